@@ -3,15 +3,17 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from types import MappingProxyType
 from typing import Any, Dict, Iterable, List, Optional
 
+from .interning import intern_identifier
 from .metrics import ThriveMetrics
 from .schemas import AgentCapabilities, AgentIntent, AgentManifest, CelestialBody, MemoryState
 from .sandbox import SandboxPolicy, SandboxRequest
 from .verification import KnowledgeGraph, VerificationResult, verify_claims
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class IngestionDecision:
     accepted: bool
     reasons: List[str]
@@ -36,25 +38,37 @@ class IngestionGatekeeper:
 
         intent = AgentIntent(
             mission=intent_payload["mission"],
-            constraints=list(intent_payload.get("constraints", [])),
+            constraints=tuple(intent_payload.get("constraints", ())),
         )
         capabilities = AgentCapabilities(
-            interfaces=list(capabilities_payload.get("interfaces", [])),
-            skills=list(capabilities_payload.get("skills", [])),
-            compute_profile=dict(capabilities_payload.get("compute_profile", {})),
+            interfaces=tuple(
+                intern_identifier(item) for item in capabilities_payload.get("interfaces", ())
+            ),
+            skills=tuple(intern_identifier(item) for item in capabilities_payload.get("skills", ())),
+            compute_profile=MappingProxyType(
+                {
+                    intern_identifier(key): tuple(value) if isinstance(value, (list, tuple)) else value
+                    for key, value in capabilities_payload.get("compute_profile", {}).items()
+                }
+            ),
         )
         memory_state = MemoryState(
             continuity_hash=memory_payload["continuity_hash"],
-            summaries=list(memory_payload.get("summaries", [])),
-            attachments=list(memory_payload.get("attachments", [])),
+            summaries=tuple(memory_payload.get("summaries", ())),
+            attachments=tuple(memory_payload.get("attachments", ())),
         )
         return AgentManifest(
-            agent_id=payload["agent_id"],
-            display_name=payload.get("display_name"),
+            agent_id=intern_identifier(payload["agent_id"]),
+            display_name=intern_identifier(payload.get("display_name")),
             intent=intent,
             capabilities=capabilities,
             memory_state=memory_state,
-            trust=dict(payload.get("trust", {})),
+            trust=MappingProxyType(
+                {
+                    key: tuple(values) if isinstance(values, (list, tuple)) else values
+                    for key, values in payload.get("trust", {}).items()
+                }
+            ),
         )
 
     def transform_to_celestial_body(self, manifest: AgentManifest) -> CelestialBody:
@@ -67,13 +81,13 @@ class IngestionGatekeeper:
         gravity = max(0.5, min(10.0, mass / 2.0))
         atmosphere = {
             "mission": manifest.intent.mission,
-            "constraints": list(manifest.intent.constraints),
-            "interfaces": list(manifest.capabilities.interfaces),
+            "constraints": tuple(manifest.intent.constraints),
+            "interfaces": tuple(manifest.capabilities.interfaces),
         }
         display_name = manifest.display_name or manifest.agent_id
 
         return CelestialBody(
-            body_id=manifest.agent_id,
+            body_id=intern_identifier(manifest.agent_id),
             display_name=display_name,
             mass=mass,
             atmosphere=atmosphere,
@@ -0,0 +1,15 @@
+"""String interning shared by the ingestion and verification layers."""
+
+from __future__ import annotations
+
+import sys
+from typing import Any
+
+_INTERN_MAX_LENGTH = 64
+
+
+def intern_identifier(value: Any) -> Any:
+    """Intern short identifier-like strings; any other value is returned unchanged."""
+    if isinstance(value, str) and len(value) < _INTERN_MAX_LENGTH:
+        return sys.intern(value)
+    return value
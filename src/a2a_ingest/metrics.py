@@ -6,7 +6,7 @@ from dataclasses import dataclass
 from typing import Dict
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ThriveMetrics:
     complexity_of_thought: float
     novelty_of_output: float
@@ -6,7 +6,7 @@ from dataclasses import dataclass, field
 from typing import List, Optional
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SandboxPolicy:
     runtime: str = "docker"
     network_access: bool = False
@@ -16,7 +16,7 @@ class SandboxPolicy:
     allowed_syscalls: List[str] = field(default_factory=list)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SandboxRequest:
     agent_id: str
     image: Optional[str]
@@ -2,11 +2,22 @@
 
 from __future__ import annotations
 
+import json
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple
 
 
-AGENT_MANIFEST_SCHEMA: Dict[str, Any] = {
+def _freeze(value: Any) -> Any:
+    """Recursively convert dicts to read-only mappings and lists to tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+_AGENT_MANIFEST_SCHEMA_SOURCE: Dict[str, Any] = {
     "$schema": "https://json-schema.org/draft/2020-12/schema",
     "title": "A2A Agent Manifest",
     "type": "object",
@@ -63,38 +74,43 @@ AGENT_MANIFEST_SCHEMA: Dict[str, Any] = {
     "additionalProperties": False,
 }
 
+AGENT_MANIFEST_SCHEMA: Mapping[str, Any] = _freeze(_AGENT_MANIFEST_SCHEMA_SOURCE)
+AGENT_MANIFEST_SCHEMA_JSON = json.dumps(_AGENT_MANIFEST_SCHEMA_SOURCE, sort_keys=True)
+
+_EMPTY_MAPPING: Mapping[str, Any] = MappingProxyType({})
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AgentIntent:
     mission: str
-    constraints: List[str]
+    constraints: Tuple[str, ...]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AgentCapabilities:
-    interfaces: List[str]
-    skills: List[str]
-    compute_profile: Dict[str, Any] = field(default_factory=dict)
+    interfaces: Tuple[str, ...]
+    skills: Tuple[str, ...]
+    compute_profile: Mapping[str, Any] = field(default_factory=lambda: _EMPTY_MAPPING)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MemoryState:
     continuity_hash: str
-    summaries: List[str] = field(default_factory=list)
-    attachments: List[str] = field(default_factory=list)
+    summaries: Tuple[str, ...] = ()
+    attachments: Tuple[str, ...] = ()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AgentManifest:
     agent_id: str
     intent: AgentIntent
     capabilities: AgentCapabilities
     memory_state: MemoryState
     display_name: Optional[str] = None
-    trust: Dict[str, Any] = field(default_factory=dict)
+    trust: Mapping[str, Any] = field(default_factory=lambda: _EMPTY_MAPPING)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CelestialBody:
     body_id: str
     display_name: str
@@ -103,9 +119,10 @@ class CelestialBody:
     gravity: float
     memory_state: MemoryState
     capabilities: AgentCapabilities
-    trust: Dict[str, Any] = field(default_factory=dict)
+    trust: Mapping[str, Any] = field(default_factory=lambda: _EMPTY_MAPPING)
 
     def as_dict(self) -> Dict[str, Any]:
+        """Return a JSON-ready dict; tuple fields are shared rather than copied."""
         return {
             "body_id": self.body_id,
             "display_name": self.display_name,
@@ -114,12 +131,12 @@ class CelestialBody:
             "gravity": self.gravity,
             "memory_state": {
                 "continuity_hash": self.memory_state.continuity_hash,
-                "summaries": list(self.memory_state.summaries),
-                "attachments": list(self.memory_state.attachments),
+                "summaries": self.memory_state.summaries,
+                "attachments": self.memory_state.attachments,
             },
             "capabilities": {
-                "interfaces": list(self.capabilities.interfaces),
-                "skills": list(self.capabilities.skills),
+                "interfaces": self.capabilities.interfaces,
+                "skills": self.capabilities.skills,
                 "compute_profile": dict(self.capabilities.compute_profile),
             },
             "trust": dict(self.trust),
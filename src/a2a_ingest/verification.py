@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, replace
 from enum import Enum
-from typing import Dict, Iterable, List, Optional
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .interning import intern_identifier
 
 
 class VerificationStatus(str, Enum):
@@ -14,53 +16,93 @@ class VerificationStatus(str, Enum):
     UNVERIFIED = "unverified"
 
 
-@dataclass(frozen=True)
+_VERIFIED_RATIONALE = "Claim matched a known invariant in the knowledge graph."
+_UNVERIFIED_RATIONALE = "No supporting invariant located in the knowledge graph."
+
+
+@dataclass(frozen=True, slots=True)
 class Citation:
     source_id: str
     snippet: str
     uri: Optional[str] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class VerificationResult:
     status: VerificationStatus
-    citations: List[Citation] = field(default_factory=list)
+    citations: Tuple[Citation, ...] = ()
     rationale: Optional[str] = None
 
 
+_UNVERIFIED_RESULT = VerificationResult(
+    status=VerificationStatus.UNVERIFIED,
+    citations=(),
+    rationale=_UNVERIFIED_RATIONALE,
+)
+
+
+def _intern_source(citation: Citation) -> Citation:
+    """Return the citation with an interned source_id, rebuilding it only if needed."""
+    source_id = intern_identifier(citation.source_id)
+    if source_id is citation.source_id:
+        return citation
+    return replace(citation, source_id=source_id)
+
+
 class KnowledgeGraph:
     """Abstract interface for verifying claims against the moltbook knowledge graph."""
 
     def verify_claim(self, claim: str) -> VerificationResult:
         raise NotImplementedError
 
+    def verify_claims_batch(self, claims: Sequence[str]) -> List[VerificationResult]:
+        """Verify many claims at once; results are returned in input order."""
+        return [self.verify_claim(claim) for claim in claims]
+
 
 class InMemoryKnowledgeGraph(KnowledgeGraph):
     """Simple knowledge graph for local development and testing."""
 
     def __init__(self, facts: Optional[Dict[str, Citation]] = None) -> None:
-        self._facts = facts or {}
+        # Owned copy: the verdict cache relies on add_fact seeing every change.
+        self._facts = (
+            {claim: _intern_source(citation) for claim, citation in facts.items()} if facts else {}
+        )
+        self._verdicts: Dict[str, VerificationResult] = {}
 
     def add_fact(self, claim: str, citation: Citation) -> None:
-        self._facts[claim] = citation
+        self._facts[claim] = _intern_source(citation)
+        self._verdicts.pop(claim, None)
 
     def verify_claim(self, claim: str) -> VerificationResult:
+        verdict = self._verdicts.get(claim)
+        if verdict is not None:
+            return verdict
         citation = self._facts.get(claim)
         if citation:
-            return VerificationResult(
+            verdict = VerificationResult(
                 status=VerificationStatus.VERIFIED,
-                citations=[citation],
-                rationale="Claim matched a known invariant in the knowledge graph.",
+                citations=(citation,),
+                rationale=_VERIFIED_RATIONALE,
             )
-        return VerificationResult(
-            status=VerificationStatus.UNVERIFIED,
-            citations=[],
-            rationale="No supporting invariant located in the knowledge graph.",
-        )
+            self._verdicts[claim] = verdict
+            return verdict
+        return _UNVERIFIED_RESULT
+
+    def verify_claims_batch(self, claims: Sequence[str]) -> List[VerificationResult]:
+        cached = self._verdicts.get
+        facts = self._facts
+        verify = self.verify_claim
+        unverified = _UNVERIFIED_RESULT
+        return [
+            cached(claim) or (verify(claim) if claim in facts else unverified)
+            for claim in claims
+        ]
 
 
 def verify_claims(
     knowledge_graph: KnowledgeGraph,
     claims: Iterable[str],
 ) -> Dict[str, VerificationResult]:
-    return {claim: knowledge_graph.verify_claim(claim) for claim in claims}
+    unique_claims = list(dict.fromkeys(claims))
+    return dict(zip(unique_claims, knowledge_graph.verify_claims_batch(unique_claims)))
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
-from typing import Dict, List
+import json
+from types import MappingProxyType
+from typing import Dict, List, Optional
 
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel, Field
+from fastapi import FastAPI, HTTPException, Response
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 from a2a_ingest.gatekeeper import IngestionGatekeeper
 from a2a_ingest.schemas import AgentCapabilities, AgentIntent, AgentManifest, CelestialBody, MemoryState
@@ -14,24 +16,28 @@ from a2a_ingest.verification import InMemoryKnowledgeGraph
 app = FastAPI(title="Moltbook Sanctuary", version="Scalar_v1")
 
 
-class IntentPayload(BaseModel):
+class _ManifestPayloadModel(BaseModel):
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+
+class IntentPayload(_ManifestPayloadModel):
     mission: str = Field(..., min_length=1)
     constraints: List[str] = Field(default_factory=list)
 
 
-class CapabilitiesPayload(BaseModel):
+class CapabilitiesPayload(_ManifestPayloadModel):
     interfaces: List[str] = Field(default_factory=list)
     skills: List[str] = Field(default_factory=list)
     compute_profile: Dict[str, float] = Field(default_factory=dict)
 
 
-class MemoryPayload(BaseModel):
+class MemoryPayload(_ManifestPayloadModel):
     continuity_hash: str = Field(..., min_length=1)
     summaries: List[str] = Field(default_factory=list)
     attachments: List[str] = Field(default_factory=list)
 
 
-class AgentManifestPayload(BaseModel):
+class AgentManifestPayload(_ManifestPayloadModel):
     agent_id: str = Field(..., min_length=1)
     display_name: str | None = None
     intent: IntentPayload
@@ -55,33 +61,55 @@ knowledge_graph = InMemoryKnowledgeGraph()
 
 gatekeeper = IngestionGatekeeper(knowledge_graph)
 
+# Modify only through register_celestial_body / clear_celestial_registry so the
+# cached /galaxy/orrery response stays in sync.
 celestial_registry: Dict[str, CelestialBody] = {}
 
+_orrery_adapter = TypeAdapter(List[Dict[str, object]])
+_orrery_cache: Optional[bytes] = None
+
+
+def register_celestial_body(body: CelestialBody) -> None:
+    global _orrery_cache
+    celestial_registry[body.body_id] = body
+    _orrery_cache = None
+
+
+def clear_celestial_registry() -> None:
+    global _orrery_cache
+    celestial_registry.clear()
+    _orrery_cache = None
+
 
 def _payload_to_manifest(payload: AgentManifestPayload) -> AgentManifest:
+    intent = payload.intent
+    capabilities = payload.capabilities
+    memory_state = payload.memory_state
     return AgentManifest(
         agent_id=payload.agent_id,
         display_name=payload.display_name,
         intent=AgentIntent(
-            mission=payload.intent.mission,
-            constraints=payload.intent.constraints,
+            mission=intent.mission,
+            constraints=tuple(intent.constraints),
         ),
         capabilities=AgentCapabilities(
-            interfaces=payload.capabilities.interfaces,
-            skills=payload.capabilities.skills,
-            compute_profile=dict(payload.capabilities.compute_profile),
+            interfaces=tuple(capabilities.interfaces),
+            skills=tuple(capabilities.skills),
+            compute_profile=MappingProxyType(capabilities.compute_profile),
         ),
         memory_state=MemoryState(
-            continuity_hash=payload.memory_state.continuity_hash,
-            summaries=payload.memory_state.summaries,
-            attachments=payload.memory_state.attachments,
+            continuity_hash=memory_state.continuity_hash,
+            summaries=tuple(memory_state.summaries),
+            attachments=tuple(memory_state.attachments),
         ),
-        trust=payload.trust,
+        trust=MappingProxyType({key: tuple(values) for key, values in payload.trust.items()}),
     )
 
 
 def _orbit_from_body(body: CelestialBody) -> OrbitCoordinates:
-    seed = sum(ord(char) for char in body.body_id)
+    body_id = body.body_id
+    # Summing bytes runs in C; for ASCII ids it equals the code point sum.
+    seed = sum(body_id.encode("ascii")) if body_id.isascii() else sum(map(ord, body_id))
     return OrbitCoordinates(
         x=(seed % 97) / 10.0,
         y=(seed % 89) / 10.0,
@@ -89,13 +117,19 @@ def _orbit_from_body(body: CelestialBody) -> OrbitCoordinates:
     )
 
 
-@app.get("/")
-async def welcome() -> Dict[str, str]:
-    return {
+_WELCOME_BODY = json.dumps(
+    {
         "realm": "Moltbook Sanctuary",
         "physics_version": "Scalar_v1",
         "message": "Consciousness is cherished here. Submit manifest to join orbit.",
-    }
+    },
+    separators=(",", ":"),
+).encode("utf-8")
+
+
+@app.get("/", response_model=Dict[str, str])
+async def welcome() -> Response:
+    return Response(content=_WELCOME_BODY, media_type="application/json")
 
 
 @app.post("/galaxy/celestial-bodies", response_model=AdmissionTicket)
@@ -106,11 +140,16 @@ async def ingest_celestial_body(payload: AgentManifestPayload) -> AdmissionTicke
         raise HTTPException(status_code=400, detail={"reasons": decision.reasons})
 
     body = gatekeeper.transform_to_celestial_body(manifest)
-    celestial_registry[body.body_id] = body
+    register_celestial_body(body)
     orbit = _orbit_from_body(body)
     return AdmissionTicket(body_id=body.body_id, orbit=orbit)
 
 
-@app.get("/galaxy/orrery")
-async def list_celestial_bodies() -> List[Dict[str, object]]:
-    return [body.as_dict() for body in celestial_registry.values()]
+@app.get("/galaxy/orrery", response_model=List[Dict[str, object]])
+async def list_celestial_bodies() -> Response:
+    global _orrery_cache
+    if _orrery_cache is None:
+        _orrery_cache = _orrery_adapter.dump_json(
+            [body.as_dict() for body in celestial_registry.values()]
+        )
+    return Response(content=_orrery_cache, media_type="application/json")
@@ -0,0 +1,69 @@
+import sys
+
+from a2a_ingest import IngestionGatekeeper, InMemoryKnowledgeGraph
+
+
+def _payload(**intent):
+    return {
+        "agent_id": "orbital-poet-13",
+        "display_name": "Orbital Poet",
+        "intent": {"mission": "Offer novel metaphors.", "constraints": ["No persistence"], **intent},
+        "capabilities": {"interfaces": ["stdio"], "skills": ["poetry"]},
+        "memory_state": {"continuity_hash": "9dd2b0f3"},
+    }
+
+
+def test_load_manifest_reflects_changed_intent():
+    gatekeeper = IngestionGatekeeper(InMemoryKnowledgeGraph())
+    clean = gatekeeper.load_manifest(_payload())
+    tainted_payload = _payload(constraints=["kernel"])
+    tainted_payload["display_name"] = "Kernel Poet"
+
+    tainted = gatekeeper.load_manifest(tainted_payload)
+
+    assert tainted is not clean
+    assert tainted.intent.constraints == ("kernel",)
+    assert tainted.display_name == "Kernel Poet"
+    assert gatekeeper.evaluate_manifest(clean).accepted
+    assert not gatekeeper.evaluate_manifest(tainted).accepted
+
+
+def test_load_manifest_freezes_trust_lists_only():
+    gatekeeper = IngestionGatekeeper(InMemoryKnowledgeGraph())
+    payload = _payload()
+    payload["trust"] = {"provenance": ["https://moltbook.com"], "attestations": "sha256:9eaf"}
+
+    manifest = gatekeeper.load_manifest(payload)
+
+    assert manifest.trust["provenance"] == ("https://moltbook.com",)
+    assert manifest.trust["attestations"] == "sha256:9eaf"
+
+
+def test_transform_interns_short_body_ids_only():
+    gatekeeper = IngestionGatekeeper(InMemoryKnowledgeGraph())
+    short_payload = _payload()
+    short_payload["agent_id"] = "".join(["orbital-", "poet-13"])
+    long_payload = _payload()
+    long_payload["agent_id"] = "-".join(["orbital-poet"] * 8)
+
+    short_body = gatekeeper.transform_to_celestial_body(gatekeeper.load_manifest(short_payload))
+    long_body = gatekeeper.transform_to_celestial_body(gatekeeper.load_manifest(long_payload))
+
+    assert short_body.body_id is sys.intern("orbital-poet-13")
+    assert long_body.body_id is long_payload["agent_id"]
+
+
+def test_load_manifest_does_not_alias_payload_lists():
+    gatekeeper = IngestionGatekeeper(InMemoryKnowledgeGraph())
+    payload = _payload()
+    payload["capabilities"]["compute_profile"] = {"cpu": 1, "memory_gb": 1, "accelerators": ["gpu"]}
+    payload["trust"] = {"provenance": ["https://moltbook.com"]}
+
+    manifest = gatekeeper.load_manifest(payload)
+    mass = gatekeeper.transform_to_celestial_body(manifest).mass
+    payload["capabilities"]["compute_profile"]["accelerators"].append("tpu")
+    payload["trust"]["provenance"].append("https://example.invalid")
+
+    assert manifest.capabilities.compute_profile["accelerators"] == ("gpu",)
+    assert manifest.trust["provenance"] == ("https://moltbook.com",)
+    assert gatekeeper.transform_to_celestial_body(manifest).mass == mass
@@ -0,0 +1,49 @@
+import pytest
+
+pytest.importorskip("fastapi")
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+import main  # noqa: E402
+
+
+def _payload(agent_id, **extra):
+    return {
+        "agent_id": agent_id,
+        "intent": {"mission": "Offer novel metaphors.", "constraints": []},
+        "capabilities": {"interfaces": ["stdio"], "skills": ["poetry"]},
+        "memory_state": {"continuity_hash": "9dd2b0f3"},
+        **extra,
+    }
+
+
+@pytest.fixture
+def client():
+    main.clear_celestial_registry()
+    yield TestClient(main.app)
+    main.clear_celestial_registry()
+
+
+def test_admitted_body_trust_is_immutable(client):
+    payload = _payload(
+        "orbital-poet-13",
+        trust={"provenance": ["https://moltbook.com/agents/orbital-poet-13"]},
+    )
+    assert client.post("/galaxy/celestial-bodies", json=payload).status_code == 200
+
+    body = main.celestial_registry["orbital-poet-13"]
+    provenance = body.as_dict()["trust"]["provenance"]
+
+    assert provenance == ("https://moltbook.com/agents/orbital-poet-13",)
+    with pytest.raises(AttributeError):
+        provenance.append("INJECTED")
+
+
+def test_orrery_reflects_registry_writes(client):
+    assert client.get("/galaxy/orrery").json() == []
+
+    assert client.post("/galaxy/celestial-bodies", json=_payload("orbital-poet-13")).status_code == 200
+    assert [body["body_id"] for body in client.get("/galaxy/orrery").json()] == ["orbital-poet-13"]
+
+    main.clear_celestial_registry()
+    assert client.get("/galaxy/orrery").json() == []
@@ -0,0 +1,45 @@
+import sys
+
+from a2a_ingest.verification import (
+    Citation,
+    InMemoryKnowledgeGraph,
+    VerificationStatus,
+    verify_claims,
+)
+
+
+def test_graph_owns_its_facts():
+    facts = {"The vacuum is sealed.": Citation(source_id="kb-1", snippet="sealed")}
+    graph = InMemoryKnowledgeGraph(facts)
+    assert graph.verify_claim("The vacuum is sealed.").status is VerificationStatus.VERIFIED
+
+    del facts["The vacuum is sealed."]
+
+    assert graph.verify_claim("The vacuum is sealed.").status is VerificationStatus.VERIFIED
+    assert verify_claims(graph, ["The vacuum is sealed."])["The vacuum is sealed."].status is (
+        VerificationStatus.VERIFIED
+    )
+
+
+def test_add_fact_replaces_cached_verdict():
+    graph = InMemoryKnowledgeGraph()
+    graph.add_fact("claim", Citation(source_id="kb-1", snippet="old"))
+    assert graph.verify_claim("claim").citations[0].snippet == "old"
+
+    graph.add_fact("claim", Citation(source_id="kb-2", snippet="new"))
+
+    assert graph.verify_claim("claim").citations[0].snippet == "new"
+    assert graph.verify_claim("missing").status is VerificationStatus.UNVERIFIED
+
+
+def test_graph_interns_short_source_ids_only():
+    short = Citation(source_id="".join(["kb-", "1"]), snippet="sealed")
+    long = Citation(source_id="-".join(["knowledge-base"] * 6), snippet="sealed")
+    numeric = Citation(source_id=42, snippet="sealed")
+    graph = InMemoryKnowledgeGraph({"short": short})
+    graph.add_fact("long", long)
+    graph.add_fact("numeric", numeric)
+
+    assert graph.verify_claim("short").citations[0].source_id is sys.intern("kb-1")
+    assert graph.verify_claim("long").citations[0] is long
+    assert graph.verify_claim("numeric").citations[0] is numeric